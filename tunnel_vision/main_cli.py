@@ -1,8 +1,10 @@
 import logging
 import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 
-from PyQt6.QtCore import QPoint, QRect, QRectF, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen
+from PyQt6.QtCore import QRect, QRectF, Qt, QTimer
+from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen, QPixmap, QRegion, QStaticText, QTransform
 from PyQt6.QtWidgets import QApplication, QWidget
 
 # Set up logging
@@ -24,25 +26,20 @@ except ImportError as e:
     MACOS_MODULES_AVAILABLE = False
     print(f"Failed to import macOS modules: {e}. Try: pip install pyobjc")
 
-
-class FocusAreaWidget(QWidget):
-    """A separate widget just for the transparent focus area"""
-
-    clicked = pyqtSignal()
-
-    def __init__(self, rect, parent=None):
-        super().__init__(parent)
-        self.focus_rect = rect
-        self.setGeometry(rect)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
-        self.setStyleSheet("background-color: transparent;")
-
-    def mousePressEvent(self, event):
-        self.clicked.emit()
-        event.accept()  # Prevent event propagation
+# Handle names in the same order as the flattened (x, y) pairs in _corner_coords
+CORNER_NAMES = ("top-left", "top-right", "bottom-left", "bottom-right", "top-middle")
 
 
 class FocusOverlayWidget(QWidget):
+    # Painting resources shared across repaints
+    _OVERLAY_COLOR = QColor(0, 0, 0, 200)
+    _CLEAR_COLOR = QColor(0, 0, 0, 0)
+    _BORDER_PEN_NORMAL = QPen(QColor(170, 170, 190), 2)  # Muted blue-gray for normal
+    _BORDER_PEN_SCROLL = QPen(QColor(155, 206, 223), 3)
+    _HANDLE_COLOR_NORMAL = QColor(255, 255, 255)
+    _HANDLE_COLOR_SCROLL = QColor(155, 206, 223)
+    _TEXT_PEN = QPen(QColor(200, 200, 200), 1)
+
     def __init__(self):
         super().__init__()
 
@@ -52,11 +49,18 @@ class FocusOverlayWidget(QWidget):
         self.always_on_top = True
 
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # The cached overlay covers every pixel, so skip the system background erase
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
 
-        # Define the focus rectangle with rounded corners
-        self.focus_rect = QRect(200, 150, 800, 500)
+        # Rounded corners for the focus rectangle
         self.corner_radius = 20  # radius for rounded corners
 
+        # Cached dark overlay with the focus area cut out; reallocated only on size, scale or corner radius changes
+        self._overlay_cache: QPixmap | None = None
+        self._overlay_cache_key = None
+        self._overlay_cache_rect = QRect()  # Focus rectangle currently cut out of the cached overlay
+
         # Variables to manage dragging of the corners
         self.dragging = False
         self.drag_corner = None
@@ -67,37 +71,130 @@ class FocusOverlayWidget(QWidget):
         self.hit_threshold = 14
         self.handle_size = 10  # Size of the visible corner handles
 
+        # Handle positions as flat x, y pairs ordered like CORNER_NAMES, rebuilt whenever focus_rect changes
+        self._corner_coords = array("i")
+
+        # Define the focus rectangle; assigning it rebuilds the handle positions
+        self.focus_rect = QRect(200, 150, 800, 500)
+
         # Auto-scroll variables
         self.auto_scrolling = False
-        # Remove the scroll_timer and just keep smooth_scroll_timer
+        # Single-shot timer re-armed after each scroll step while auto-scrolling is on
         self.smooth_scroll_timer = QTimer(self)
+        self.smooth_scroll_timer.setSingleShot(True)
         self.smooth_scroll_timer.timeout.connect(self.perform_smooth_scroll)
-        self.scroll_speed = -1  # default lines per scroll
-        self.scroll_interval = 10000  # milliseconds
+        self.scroll_speed = -1  # default pixels per scroll step
+        self.scroll_interval = 10000  # milliseconds spread across smooth_scroll_steps
         self.smooth_scroll_steps = 50  # Number of steps for smooth scrolling
-        self.current_smooth_step = 0
+        # Scroll wheel events keyed by signed pixel delta, reused across ticks
+        self._scroll_event_cache = {}
+        # Dedicated worker so posting to the HID event tap never blocks the UI thread
+        self._scroll_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scroll-post")
+        self._pending_scroll_post = None
+        self._recompute_delta()
 
         # Status display
         self.last_action = "Ready"
 
-        # Create a separate widget for the focus area
-        self.focus_area = FocusAreaWidget(self.focus_rect, self)
-
         # Set cursor for corners
         self.setMouseTracking(True)  # Enable mouse tracking for cursor changes
 
-    def update_focus_area_geometry(self):
-        """Update the focus area widget to match the focus rectangle"""
-        self.focus_area.setGeometry(self.focus_rect)
-        self.focus_area.focus_rect = self.focus_rect
+        # Keyboard shortcuts and current status, rebuilt only when the state they show changes
+        self._info_lines = []
+        self._static_lines = []
+        self._rebuild_info_lines()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _rebuild_info_lines(self):
+        """Refresh the keyboard shortcuts and status text shown in the corner"""
+        self._info_lines = [
+            "ESC: Exit",
+            f"SPACE: Scroll Direction [{('DOWN' if self.scroll_speed < 0 else 'UP')}]",
+            f"+/-: Scroll Speed [{abs(self.scroll_speed)}]",
+            f"S: Auto-Scroll [{('ON' if self.auto_scrolling else 'OFF')}]",
+            f"T: Always on Top [{('ON' if self.always_on_top else 'OFF')}]",
+        ]
 
-        # Fill the entire window with a semi-transparent dark overlay
-        overlay_color = QColor(0, 0, 0, 200)
-        painter.fillRect(self.rect(), overlay_color)
+        # Lay out glyphs once per text change instead of on every repaint
+        font = self.font()
+        self._static_lines = []
+        for info_text in self._info_lines:
+            static_text = QStaticText(info_text)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), font)
+            self._static_lines.append(static_text)
+
+    def _update_mask(self):
+        """Let clicks inside the focus area fall through to underlying apps while auto-scrolling"""
+        if not self.auto_scrolling:
+            self.clearMask()
+            return
+
+        # Inset the hole by half a handle so the border and handles stay painted and draggable
+        inset = self.handle_size / 2
+        path = QPainterPath()
+        path.addRoundedRect(
+            QRectF(self.focus_rect).adjusted(inset, inset, -inset, -inset), self.corner_radius, self.corner_radius
+        )
+        hole = QRegion(path.toFillPolygon().toPolygon())
+        self.setMask(QRegion(self.rect()).subtracted(hole))
+
+    @property
+    def focus_rect(self):
+        """The transparent focus rectangle"""
+        return self._focus_rect
+
+    @focus_rect.setter
+    def focus_rect(self, rect):
+        # Keep every geometry-derived cache in sync with the rectangle in one place;
+        # the overlay pixmap tracks its own cut-out and catches up in paintEvent
+        self._focus_rect = rect
+        self._rebuild_corners()
+
+    def _rebuild_corners(self):
+        """Recompute the corner and middle handle positions from the focus rectangle"""
+        rect = self.focus_rect
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+        self._corner_coords = array("i", (left, top, right, top, left, bottom, right, bottom, rect.center().x(), top))
+
+        # Batch all corner and middle handles into a single path so they are filled in one call
+        handle_size = self.handle_size
+        half_handle = handle_size / 2
+        handles_path = QPainterPath()
+        coords = self._corner_coords
+        for i in range(0, len(coords), 2):
+            # Circular handle centered on corner
+            handles_path.addEllipse(
+                QRectF(coords[i] - half_handle, coords[i + 1] - half_handle, handle_size, handle_size)
+            )
+        self._handles_path = handles_path
+
+    def _corner_at(self, pos):
+        """Return the name of the handle under the given position, or None"""
+        px, py = pos.x(), pos.y()
+        threshold = self.hit_threshold
+        coords = self._corner_coords
+        for i in range(0, len(coords), 2):
+            dx = coords[i] - px
+            dy = coords[i + 1] - py
+            if (dx if dx >= 0 else -dx) <= threshold and (dy if dy >= 0 else -dy) <= threshold:
+                return CORNER_NAMES[i >> 1]
+        return None
+
+    def _render_overlay_cache(self, band=None):
+        """Render the dark overlay with the rounded focus area cleared into the cached pixmap
+
+        Without a band the whole pixmap is painted; with one, only that area is repainted.
+        """
+        painter = QPainter(self._overlay_cache)
+        if band is not None:
+            painter.setClipRect(band)
+
+        # Fill with a semi-transparent dark overlay, replacing the old cut-out; axis-aligned, so no antialiasing needed
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(self.rect() if band is None else band, self._OVERLAY_COLOR)
+
+        # Only the rounded corners of the cut-out need antialiasing
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
         # Set the composition mode to clear so that the focus rectangle becomes transparent
         painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
@@ -105,59 +202,71 @@ class FocusOverlayWidget(QWidget):
         # Create a path with a rounded rectangle for the focus area
         path = QPainterPath()
         path.addRoundedRect(QRectF(self.focus_rect), self.corner_radius, self.corner_radius)
-        painter.fillPath(path, QColor(0, 0, 0, 0))
+        painter.fillPath(path, self._CLEAR_COLOR)
+        painter.end()
 
-        # Draw an outline around the focus rectangle
+        self._overlay_cache_rect = QRect(self.focus_rect)
+
+    def paintEvent(self, event):
+        # Skip painting when the widget's own clipping or mask leaves nothing visible (other windows are not considered)
+        if self.visibleRegion().isEmpty():
+            return
+
+        # Reallocate the overlay only when the window size or scale changes
+        dpr = self.devicePixelRatioF()
+        cache_key = (self.size(), dpr, self.corner_radius)
+        if self._overlay_cache is None or cache_key != self._overlay_cache_key:
+            self._overlay_cache = QPixmap(self.size() * dpr)
+            self._overlay_cache.setDevicePixelRatio(dpr)
+            # A fresh pixmap has no alpha channel until it is filled with a translucent colour
+            self._overlay_cache.fill(Qt.GlobalColor.transparent)
+            self._overlay_cache_key = cache_key
+            self._render_overlay_cache()
+        elif self._overlay_cache_rect != self.focus_rect:
+            # Repaint just the band covering the old and new cut-out, padded for antialiased edges
+            band = self._overlay_cache_rect.united(self.focus_rect).adjusted(-2, -2, 2, 2)
+            self._render_overlay_cache(band)
+
+        painter = QPainter(self)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawPixmap(0, 0, self._overlay_cache)
+
+        # Draw an outline around the focus rectangle; the rounded border and handles need antialiasing
         painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
         # Use different colors based on state
-        border_pen = (
-            QPen(QColor(155, 206, 223), 3) if self.auto_scrolling else QPen(QColor(170, 170, 190), 2)
-        )  # Muted blue-gray for normal
-
-        painter.setPen(border_pen)
+        painter.setPen(self._BORDER_PEN_SCROLL if self.auto_scrolling else self._BORDER_PEN_NORMAL)
         painter.drawRoundedRect(self.focus_rect, self.corner_radius, self.corner_radius)
 
         # Draw corner handles
-        handle_color = QColor(255, 255, 255)
-        if self.auto_scrolling:
-            handle_color = QColor(155, 206, 223)
-
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(handle_color)
-
-        # Draw the corner and middle handles
-        corners = {
-            "top-left": self.focus_rect.topLeft(),
-            "top-right": self.focus_rect.topRight(),
-            "bottom-left": self.focus_rect.bottomLeft(),
-            "bottom-right": self.focus_rect.bottomRight(),
-            "top-middle": QPoint(self.focus_rect.center().x(), self.focus_rect.top()),
-        }
-
-        for _, point in corners.items():
-            # Draw circular handle centered on corner
-            handle_rect = QRectF(
-                point.x() - self.handle_size / 2, point.y() - self.handle_size / 2, self.handle_size, self.handle_size
-            )
-            painter.drawEllipse(handle_rect)
+        painter.fillPath(
+            self._handles_path, self._HANDLE_COLOR_SCROLL if self.auto_scrolling else self._HANDLE_COLOR_NORMAL
+        )
 
-        # Merge keyboard shortcuts and current status
-        info_display = [
-            "ESC: Exit",
-            f"SPACE: Scroll Direction [{('DOWN' if self.scroll_speed < 0 else 'UP')}]",
-            f"+/-: Scroll Speed [{abs(self.scroll_speed)}]",
-            f"S: Auto-Scroll [{('ON' if self.auto_scrolling else 'OFF')}]",
-            f"T: Always on Top [{('ON' if self.always_on_top else 'OFF')}]",
-        ]
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
 
-        # Draw merged info
-        debug_y = self.height() - 140
-        painter.setPen(QPen(QColor(200, 200, 200), 1))
-        for info_text in info_display:
-            painter.drawText(10, debug_y, info_text)
+        # Draw merged info; static text is positioned by its top edge rather than the baseline
+        debug_y = self.height() - 140 - self.fontMetrics().ascent()
+        painter.setPen(self._TEXT_PEN)
+        for static_text in self._static_lines:
+            painter.drawStaticText(10, debug_y, static_text)
             debug_y += 20
 
+    def _focus_dirty_rect(self, rect):
+        """Area covered by the focus rectangle including its border and handles"""
+        margin = self.handle_size + 10
+        return rect.adjusted(-margin, -margin, margin, margin)
+
+    def _info_text_rect(self):
+        """Area covered by the keyboard shortcuts and status text"""
+        return QRect(0, self.height() - 160, 400, 160)
+
+    def resizeEvent(self, event):
+        """Keep the click-through mask in sync with the window size"""
+        super().resizeEvent(event)
+        self._update_mask()
+
     def _get_mouse_position(self, event):
         """Get mouse position regardless of Qt version"""
         return event.position().toPoint() if hasattr(event, "position") else event.pos()
@@ -214,21 +323,14 @@ class FocusOverlayWidget(QWidget):
         if self.dragging:
             dx = pos.x() - self.drag_start_pos.x()
             dy = pos.y() - self.drag_start_pos.y()
+            previous_rect = self.focus_rect
             self.focus_rect = self._update_rect_dimensions(self.original_rect, dx, dy, self.drag_corner)
-            self.update()
+            # Only repaint the band between the old and new focus rectangle
+            self.update(self._focus_dirty_rect(previous_rect.united(self.focus_rect)))
         else:
-            corners = {
-                "top-left": self.focus_rect.topLeft(),
-                "top-right": self.focus_rect.topRight(),
-                "bottom-left": self.focus_rect.bottomLeft(),
-                "bottom-right": self.focus_rect.bottomRight(),
-                "top-middle": QPoint(self.focus_rect.center().x(), self.focus_rect.top()),
-            }
-
-            for corner, point in corners.items():
-                if abs(point.x() - pos.x()) <= self.hit_threshold and abs(point.y() - pos.y()) <= self.hit_threshold:
-                    self._update_cursor_for_corner(corner)
-                    break
+            corner = self._corner_at(pos)
+            if corner is not None:
+                self._update_cursor_for_corner(corner)
             else:  # No corner detected
                 self.setCursor(Qt.CursorShape.ArrowCursor)
 
@@ -237,83 +339,89 @@ class FocusOverlayWidget(QWidget):
         pos = self._get_mouse_position(event)
 
         # Check if near corner for dragging
-        corners = {
-            "top-left": self.focus_rect.topLeft(),
-            "top-right": self.focus_rect.topRight(),
-            "bottom-left": self.focus_rect.bottomLeft(),
-            "bottom-right": self.focus_rect.bottomRight(),
-            "top-middle": QPoint(self.focus_rect.center().x(), self.focus_rect.top()),
-        }
-
-        for corner, point in corners.items():
-            if abs(point.x() - pos.x()) <= self.hit_threshold and abs(point.y() - pos.y()) <= self.hit_threshold:
-                self.dragging = True
-                self.drag_corner = corner
-                self.drag_start_pos = pos
-                self.original_rect = QRect(self.focus_rect)
-                self.last_action = f"Dragging {corner}"
-
-                # Hide the focus area widget during dragging
-                self.focus_area.hide()
-                return
+        corner = self._corner_at(pos)
+        if corner is not None:
+            self.dragging = True
+            self.drag_corner = corner
+            self.drag_start_pos = pos
+            self.original_rect = QRect(self.focus_rect)
+            self.last_action = f"Dragging {corner}"
+
+            # Drop the mask during dragging so the moving border is not clipped
+            self.clearMask()
 
     def toggle_auto_scroll(self):
         """Toggle auto-scrolling state"""
+        if not self.auto_scrolling and not MACOS_MODULES_AVAILABLE:
+            # Scroll events can only be posted through Quartz
+            self.last_action = "Auto-scrolling unavailable"
+            return
+
         self.auto_scrolling = not self.auto_scrolling
 
         if self.auto_scrolling:
             self.last_action = "Started auto-scrolling"
 
-            # Make the focus area widget transparent to mouse events
-            # This allows clicks to pass through to underlying applications
-            self.focus_area.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-
-            # Reset step counter and start smooth scrolling
-            self.current_smooth_step = 0
-
-            # Calculate time between smooth scrolls
-            smooth_interval = int((self.scroll_interval) / self.smooth_scroll_steps)
-            self.smooth_scroll_timer.start(smooth_interval)
+            # Schedule the first smooth scroll step
+            self.smooth_scroll_timer.start(self._next_delay_ms())
         else:
             self.last_action = "Stopped auto-scrolling"
             self.smooth_scroll_timer.stop()
 
-            # Make the focus area widget non-transparent to capture clicks again
-            self.focus_area.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
+        # Mask out the focus area so clicks pass through only while scrolling
+        self._update_mask()
+
+        # Border, handles and status text change colour/content
+        self._rebuild_info_lines()
+        self.update(self._focus_dirty_rect(self.focus_rect))
+        self.update(self._info_text_rect())
 
-        self.update()
+    def _recompute_delta(self):
+        """Refresh the signed pixel delta after scroll speed or direction changes"""
+        self._signed_delta = self.scroll_speed
+        self._scroll_event_cache.clear()
+
+    def _next_delay_ms(self):
+        """Milliseconds until the next smooth scroll step"""
+        return max(5, int(self.scroll_interval / self.smooth_scroll_steps))
+
+    @staticmethod
+    def _log_scroll_post_failure(future):
+        """Log errors raised while posting a scroll event on the worker thread"""
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Failed to send smooth scroll event: {future.exception()}")
 
     def perform_smooth_scroll(self):
         """Perform a small portion of the scroll for smoother animation"""
-        if not self.auto_scrolling or not MACOS_MODULES_AVAILABLE:
-            self.smooth_scroll_timer.stop()
+        if not self.auto_scrolling:
             return
 
-        try:
-            # Calculate pixels to scroll based on speed
-            pixels_per_step = abs(self.scroll_speed) * 1  # 5 pixels per speed unit
+        delta = self._signed_delta
 
-            # Create a scroll wheel event with pixel-based scrolling
+        # Reuse the scroll wheel event for this delta, creating it on first use
+        scroll_event = self._scroll_event_cache.get(delta)
+        if scroll_event is None:
             scroll_event = CGEventCreateScrollWheelEvent(
                 None,  # No source
                 kCGScrollEventUnitPixel,
                 1,  # Number of wheels (1 for vertical only)
-                pixels_per_step if self.scroll_speed > 0 else -pixels_per_step,
+                delta,
             )
+            if scroll_event is None:
+                # Quartz signals failure with a NULL event rather than raising
+                logger.warning("Failed to create smooth scroll event")
+                self.toggle_auto_scroll()
+                return
+            self._scroll_event_cache[delta] = scroll_event
 
-            # Post the event
-            CGEventPost(kCGHIDEventTap, scroll_event)
-
-            # Increment step counter
-            self.current_smooth_step += 1
-
-            # When we reach the end of the steps, reset counter and continue
-            if self.current_smooth_step >= self.smooth_scroll_steps:
-                self.current_smooth_step = 0
+        # Post the event off the UI thread, skipping this tick if the previous post is still queued
+        if self._pending_scroll_post is None or self._pending_scroll_post.done():
+            self._pending_scroll_post = self._scroll_pool.submit(CGEventPost, kCGHIDEventTap, scroll_event)
+            self._pending_scroll_post.add_done_callback(self._log_scroll_post_failure)
 
-        except Exception as e:
-            logging.warning(f"Failed to send smooth scroll event: {e}")
-            self.smooth_scroll_timer.stop()
+        # Re-arm for the next step only while auto-scrolling is still on
+        if self.auto_scrolling:
+            self.smooth_scroll_timer.start(self._next_delay_ms())
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release events for corner dragging"""
@@ -322,11 +430,36 @@ class FocusOverlayWidget(QWidget):
             self.drag_corner = None
             self.last_action = "Ready"
 
-            # Update and show the focus area widget
-            self.update_focus_area_geometry()
-            self.focus_area.show()
+            # Restore the click-through mask for the new focus rectangle
+            self._update_mask()
 
-            self.update()
+            self.update(self._focus_dirty_rect(self.focus_rect))
+
+    def _apply_always_on_top(self):
+        """Raise or lower the window level without recreating the native window"""
+        # Changing the flag on the QWindow updates it in place, unlike QWidget.setWindowFlags which needs a reshow
+        self.windowHandle().setFlag(Qt.WindowType.WindowStaysOnTopHint, self.always_on_top)
+        # Mirror it on the widget so windowFlags() stays accurate without reapplying it to the window
+        self.overrideWindowFlags(self.windowHandle().flags())
+
+    def hideEvent(self, event):
+        """Pause scroll ticks while the overlay is hidden"""
+        self.smooth_scroll_timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume scroll ticks if auto-scrolling was on when the overlay was hidden"""
+        super().showEvent(event)
+        if self.auto_scrolling and not self.smooth_scroll_timer.isActive():
+            self.smooth_scroll_timer.start(self._next_delay_ms())
+
+    def closeEvent(self, event):
+        """Stop scrolling and release the scroll worker thread"""
+        self.auto_scrolling = False
+        self.smooth_scroll_timer.stop()
+        # Interpreter exit still joins the worker, so drop queued posts rather than wait on them
+        self._scroll_pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
 
     def keyPressEvent(self, event):
         """Handle key press events"""
@@ -337,19 +470,18 @@ class FocusOverlayWidget(QWidget):
         # Toggle scroll direction with space
         elif event.key() == Qt.Key.Key_Space:
             self.scroll_speed = -self.scroll_speed
+            self._recompute_delta()
             direction = "DOWN" if self.scroll_speed < 0 else "UP"
             self.last_action = f"Changed scroll direction to {direction}"
-            self.update()
+            self._rebuild_info_lines()
+            self.update(self._info_text_rect())
 
         # Toggle always on top with T key
         elif event.key() == Qt.Key.Key_T:
             self.always_on_top = not self.always_on_top
-            new_flags = self.base_flags
-            if self.always_on_top:
-                new_flags |= Qt.WindowType.WindowStaysOnTopHint
-            self.setWindowFlags(new_flags)
-            self.show()  # Need to show the window again after changing flags
+            self._apply_always_on_top()
             self.last_action = "Always on top: " + ("ON" if self.always_on_top else "OFF")
+            self._rebuild_info_lines()
             self.update()
 
         # Toggle scrolling with S key
@@ -362,14 +494,18 @@ class FocusOverlayWidget(QWidget):
                 self.scroll_speed += 1
             else:
                 self.scroll_speed -= 1
-            self.update()
+            self._recompute_delta()
+            self._rebuild_info_lines()
+            self.update(self._info_text_rect())
 
         elif event.key() == Qt.Key.Key_Minus:
             if self.scroll_speed > 0:
                 self.scroll_speed = max(1, self.scroll_speed - 1)
             else:
                 self.scroll_speed = min(-1, self.scroll_speed + 1)
-            self.update()
+            self._recompute_delta()
+            self._rebuild_info_lines()
+            self.update(self._info_text_rect())
 
 
 def main():